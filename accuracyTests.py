@@ -32,7 +32,7 @@ def volumeHypersphericalCap(N, h):
     regularisedParam = mp.power(mp.sin(phi), mp2)
     betaTerm = mp.betainc((mpN + mp1) / mp2, mp1 / mp2, x2=regularisedParam,
                           regularized=True)
-    capVolume = mp.power(mp.e, log_ball_vol(mpN)) * betaTerm / mp2
+    capVolume = mp.exp(log_ball_vol(mpN)) * betaTerm / mp2
 
     # sanity checks
     if N == 2:
@@ -67,9 +67,11 @@ def testSmalls(N, s=1.5):
 
     h = mp1 - mp1 / mp.sqrt(mps)
     capsVolume = mp2 * mpN * volumeHypersphericalCap(N, h)
-    intersectionVolume = mp.power(mp.e, log_ball_vol(N)) - capsVolume
+    intersectionVolume = mp.exp(log_ball_vol(N)) - capsVolume
 
-    fresnelVolume = mp.power(mp.e, fresnelConstalesLog(N, s))
+    # a sum in floats suffices where F_N(s) is not too small, otherwise
+    # fresnelConstalesLog falls back to full precision
+    fresnelVolume = mp.exp(fresnelConstalesLog(N, s, out_prec=53))
 
     assert abs(intersectionVolume - fresnelVolume) <= 10**-5
 
@@ -80,16 +82,27 @@ def findAccurateRange():
     accurateN = None
     worsts = None
     ss = [1 + 0.05 * i for i in range(1, 20)]
-    for s in ss:
-        for N in range(200, 351, 5):
+    # the first N for which each s fails, N is the outer loop so that each
+    # dimension's precomputed terms are loaded once for all s
+    failures = {}
+    for N in range(200, 351, 5):
+        for s in ss:
+            if s in failures:
+                continue
             try:
                 testSmalls(N, s=s)
             # the exact answer differs too much from the fresnel estimate
             except AssertionError:
-                previousN = N - 5
-                if accurateN is None or previousN < accurateN:
-                    accurateN = previousN
-                    worsts = s
-                break
+                failures[s] = N
+                continue
             print("good (s, N):", s, N)
+        if len(failures) == len(ss):
+            break
+    for s in ss:
+        if s not in failures:
+            continue
+        previousN = failures[s] - 5
+        if accurateN is None or previousN < accurateN:
+            accurateN = previousN
+            worsts = s
     return accurateN, worsts
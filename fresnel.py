@@ -1,10 +1,27 @@
+import functools
+import gc
+import math
+import multiprocessing
 import os
 import pickle
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from itertools import repeat
 
 from mpmath import mp
+from mpmath.libmp import MPZ
+
+try:
+    import flint
+except ImportError:
+    flint = None
 
 default_prec = 12 * 53
 mp.prec = default_prec
+# the number of k handed to a worker at a time by precomputeFresnelTerms
+chunksize = 64
+# the number of terms between recomputations of the phase in _fresnelSeries
+phaseResync = 1000
 
 
 def default_terms(N):
@@ -14,11 +31,21 @@ def default_terms(N):
 def log_ball_vol(d, R=mp.mpf(1), prec=None):
     if prec is None:
         mp.prec = default_prec
-    mpd = mp.mpf(d)
-    return mpd * mp.log(R) + (mpd / mp.mpf(2)) * mp.log(mp.pi) - mp.loggamma(mpd/mp.mpf(2) + mp.mpf(1)) # noqa
+    return _logBallVol(mp.mpf(d), mp.mpf(R), mp.prec)
+
 
+@functools.lru_cache(maxsize=None)
+def _logBallVol(mpd, mpR, prec):
+    """
+    log_ball_vol, cached as the same few dimensions are asked for repeatedly
+    and mp.loggamma is expensive at high precision
 
-def fresnelConstalesLog(N, s, terms=None, prec=None):
+    ..note::        prec is only part of the cache key, it must be mp.prec
+    """
+    return mpd * mp.log(mpR) + (mpd / mp.mpf(2)) * mp.log(mp.pi) - mp.loggamma(mpd/mp.mpf(2) + mp.mpf(1)) # noqa
+
+
+def fresnelConstalesLog(N, s, terms=None, prec=None, out_prec=None):
     """
     Following (2.6) of https://arxiv.org/abs/1804.07861
     Comment on "Sum of squares of uniform random variables" by I. Weissman,
@@ -37,8 +64,17 @@ def fresnelConstalesLog(N, s, terms=None, prec=None):
                         if ``None`` use default_terms(N)
     :param prec:    the amount of precision with which to compute with, see
                         mpmath documentation
+    :param out_prec:    if not ``None``, first try to sum the series with
+                            this (lower) precision, the terms themselves are
+                            still precomputed with prec. If out_prec <= 53
+                            the sum is done in Python floats
 
     :returns:       log(vol([-1/sqrt(s), 1/sqrt(s)]^N ∩ B_N(1)))
+
+    ..note::        F_N(s) is found as the difference of O(1) quantities, so
+                    about log2(1 / F_N(s)) bits are lost to cancellation. If
+                    out_prec leaves fewer than half its bits of F_N(s) the
+                    series is summed again with prec.
     """
     if prec is None:
         mp.prec = default_prec
@@ -57,68 +93,407 @@ def fresnelConstalesLog(N, s, terms=None, prec=None):
 
     if mps >= mpN:
         # the entire cube
-        return N * (mp.log(mp.mpf('2')) - mp.mpf(mp.mpf('1') / mp.mpf('2')) * mp.log(mps))  # noqa
+        return N * (mp.ln2 - mp.mpf(mp.mpf('1') / mp.mpf('2')) * mp.log(mps))  # noqa
 
     constants = mp.mpf('1') / mp.mpf('6') + mps / mpN
 
     if terms is None:
         terms = default_terms(N)
 
-    fullSum = mp.mpf('0')
+    # only (re)visit the precomputation file if some terms are missing
+    try:
+        dimNPrecomputed = retrievePrecomputed(N, prec=mp.prec, terms=terms)
+    except (FileNotFoundError, KeyError):
+        precomputeFresnelTerms(N, prec=mp.prec, terms=terms)
+        dimNPrecomputed = retrievePrecomputed(N, prec=mp.prec, terms=terms)
+
+    FNs = None
+
+    if out_prec is not None and out_prec < mp.prec:
+        if out_prec <= 53:
+            doublePrecomputed = retrieveDoublePrecomputed(N, prec=mp.prec,
+                                                          terms=terms)
+            imaginarySum = mp.mpf(
+                _fresnelSeriesDoubleImag(doublePrecomputed, N, mps))
+            # each summand is found from its own phase, to within a few
+            # multiples of 2^-out_prec of its modulus
+            termError = mp.ldexp(mp.mpf('1'), 4 - out_prec)
+        else:
+            with mp.workprec(out_prec):
+                fullSum = _fresnelSeries(dimNPrecomputed, mpN, mps, terms)
+                imaginarySum = fullSum.imag
+            # the phases are chained products of up to phaseResync factors,
+            # each of which can add a few multiples of 2^-out_prec
+            termError = phaseResync * mp.ldexp(mp.mpf('1'), 4 - out_prec)
+        with mp.workprec(out_prec):
+            FNs = constants + imaginarySum / mp.pi
+        # the kth summand has modulus at most 1 / k
+        sumError = (1 + mp.log(terms)) * termError
+        if FNs <= sumError * mp.ldexp(mp.mpf('1'), out_prec // 2):
+            FNs = None
+
+    if FNs is None:
+        fullSum = _fresnelSeries(dimNPrecomputed, mpN, mps, terms)
+        imaginarySum = fullSum.imag
+        imaginarySumFinal = imaginarySum / mp.pi
+        # we have calculated (2.6)
+        FNs = constants + imaginarySumFinal
 
-    precomputeFresnelTerms(N, prec=mp.prec, terms=terms)
-    dimNPrecomputed = retrievePrecomputed(N, prec=mp.prec, terms=terms)
+    assert FNs > mp.mpf('0'), "either more terms or precision required"
+    # we return log(vol([-1/sqrt(s), 1/sqrt(s)]^N ∩ B_N(1))) using (2.3)
+    correctionFactor = mpN * mp.log(mp.mpf('2') / mp.sqrt(mps))
+    return correctionFactor + mp.log(FNs)
 
-    for k in range(1, terms + 1):
-        mpk = mp.mpf(str(int(k)))
 
+def _fresnelSeries(dimNPrecomputed, mpN, mps, terms):
+    """
+    The truncated sum of (2.6) of https://arxiv.org/abs/1804.07861, at the
+    current precision, of which fresnelConstalesLog uses the imaginary part
+
+    :param dimNPrecomputed: the terms of precomputeFresnelTerms for N
+    :param mpN:             N as an mpf
+    :param mps:             s as an mpf
+    :param terms:           the number of terms to sum
+    """
+    summands = []
+
+    # k * s / N is an integer exactly when period divides k
+    _, period = _ratioSN(int(mpN), mps)
+
+    # exp(exponentFactor * k) is found by repeated multiplication by
+    # exp(exponentFactor), and recomputed every phaseResync terms to stop the
+    # rounding errors of the product accumulating
+    exponentFactor = mp.mpf('2') * mp.pi * mp.j * mps / mpN
+    phaseStep = mp.exp(exponentFactor)
+    eTermPre = mp.mpf('1')
+
+    inverses = _inverseTable(terms, mp.prec)
+
+    for k in range(1, terms + 1):
         fresnelFinal = dimNPrecomputed[k]
 
-        if mpk * mps / mpN % mp.mpf('1') == mp.mpf('0'):
-            eTerm = mp.mpf('1') / mpk
+        if k % phaseResync == 0:
+            eTermPre = mp.exp(exponentFactor * k)
+        else:
+            eTermPre *= phaseStep
+
+        if k % period == 0:
+            # exp(exponentFactor * k) is exactly 1
+            eTermPre = mp.mpf(1)
+            eTerm = inverses[k - 1]
         else:
-            exponent = mp.mpf('2') * mp.pi * mp.j * mpk * mps / mpN
-            eTermPre = mp.power(mp.e, exponent)
-            eTerm = eTermPre / mpk
+            eTerm = eTermPre * inverses[k - 1]
 
         summand = fresnelFinal * eTerm
-        fullSum += summand
+        summands.append(summand)
 
-    imaginarySum = fullSum.imag
-    imaginarySumFinal = imaginarySum / mp.pi
-    # we have calculated (2.6)
-    FNs = constants + imaginarySumFinal
+    # summed without intermediate rounding, so only the summands themselves
+    # carry error into the cancellation in (2.6)
+    return mp.fsum(summands)
 
-    assert FNs > mp.mpf('0'), "either more terms or precision required"
-    # we return log(vol([-1/sqrt(s), 1/sqrt(s)]^N ∩ B_N(1))) using (2.3)
-    correctionFactor = mpN * mp.log(mp.mpf('2') / mp.sqrt(mps))
-    return correctionFactor + mp.log(FNs)
+
+@functools.lru_cache(maxsize=8)
+def _inverseTable(terms, prec):
+    """
+    The list of 1 / k for k = 1, ..., terms, rounded to prec
+
+    ..note::        prec is only part of the cache key, it must be mp.prec
+    """
+    return [mp.mpf(1) / mp.mpf(k) for k in range(1, terms + 1)]
+
+
+def _ratioSN(N, mps):
+    """
+    The exact value of mps / N as a reduced fraction
+
+    :param N:       we work in RR^N
+    :param mps:     s as an mpf
+
+    :returns:       a pair (numerator, denominator) of ints
+    """
+    man, exp = mps.man_exp
+    if exp >= 0:
+        numerator, denominator = man << exp, N
+    else:
+        numerator, denominator = man, N << -exp
+    divisor = math.gcd(numerator, denominator)
+    return numerator // divisor, denominator // divisor
+
+
+def _fresnelSeriesDoubleImag(doublePrecomputed, N, mps):
+    """
+    The imaginary part of _fresnelSeries, which is all fresnelConstalesLog
+    uses, in Python floats with the terms from retrieveDoublePrecomputed
+
+    ..note::        the phase k * s / N is reduced modulo 1 exactly, using the
+                    rational value of mps, before rounding to a float
+    """
+    sNum, period = _ratioSN(N, mps)
+
+    # Im(z exp(i angle)) = Re(z) sin(angle) + Im(z) cos(angle), where angle is
+    # exactly 0 when k * s / N is an integer
+    angles = [2 * math.pi * ((k * sNum) % period / period)
+              for k in range(1, len(doublePrecomputed) + 1)]
+    sin = math.sin
+    cos = math.cos
+
+    return math.fsum([(term.real * sin(angle) + term.imag * cos(angle)) / k
+                      for k, (term, angle)
+                      in enumerate(zip(doublePrecomputed, angles), start=1)])
+
+
+def _savePrecomputed(filename, precomputed):
+    """
+    Pickles precomputed terms as a dictionary of their raw mpmath (real, imag)
+    tuples, which are plain ints and so avoid mpmath's per object (un)pickling
+
+    :param precomputed: a list whose kth entry is the kth term, or ``None``
+
+    ..note::        mantissas are stored as Python ints, so that files written
+                    with the gmpy2 or Sage backends of mpmath load without them
+    """
+    raw = {k: tuple((sign, int(man), exp, bc)
+                    for sign, man, exp, bc in term._mpc_)
+           for k, term in enumerate(precomputed) if term is not None}
+    with open(filename, 'wb') as fh:
+        pickle.dump(raw, fh, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _loadPrecomputed(filename):
+    """
+    Inverse of _savePrecomputed, also accepts files of pickled mp.mpc
+
+    :returns:   a list whose kth entry is the kth term, or ``None`` if the file
+                    does not contain it, the 0th entry is always ``None``
+    """
+    # the garbage collector would repeatedly traverse the many small objects
+    # being created, while none of them can be garbage
+    gcWasEnabled = gc.isenabled()
+    gc.disable()
+    try:
+        with open(filename, 'rb') as fh:
+            raw = pickle.load(fh)
+    finally:
+        if gcWasEnabled:
+            gc.enable()
+
+    precomputed = [None] * (max(raw, default=0) + 1)
+    for k, term in raw.items():
+        if isinstance(term, tuple):
+            # the mantissas must be of the current backend's integer type
+            term = mp.make_mpc(tuple((sign, MPZ(man), exp, bc)
+                                     for sign, man, exp, bc in term))
+        precomputed[k] = term
+    return precomputed
 
 
 def retrievePrecomputed(N, terms=None, prec=None):
+    """
+    Loads the terms saved by precomputeFresnelTerms, as a list whose kth entry
+    is the kth term
+
+    ..note::        results are cached per (N, terms, prec), so the returned
+                    list should not be modified
+    """
     if terms is None:
         terms = default_terms(N)
     if prec is None:
         prec = default_prec
+    return _retrievePrecomputed(N, terms, prec)
 
+
+# a dimension's table at the default precision is several MB, and callers
+# reuse one N for many s before moving on, so only keep the last few
+@functools.lru_cache(maxsize=2)
+def _retrievePrecomputed(N, terms, prec):
+    """
+    retrievePrecomputed, cached on its arguments made positional and explicit
+    so that every way of calling it shares one entry
+    """
     filename = "precomps/" + "dim{N}-prec{p}".format(N=str(N), p=str(prec))
 
     try:
-        with open(filename, 'rb') as fh:
-            precomputed = pickle.load(fh)
+        precomputed = _loadPrecomputed(filename)
     except FileNotFoundError:
-        raise ("Ensure precomputation for dimension {N} and precision {p}"
-               .format(N=str(N), p=str(prec)))
+        raise FileNotFoundError(
+            "Ensure precomputation for dimension {N} and precision {p}"
+            .format(N=str(N), p=str(prec)))
 
     # check all required ks are present in dimNPrecomputed
-    if not all(x in precomputed.keys() for x in range(1, terms + 1)):
-        raise ("Some k are missing for dimension {N} and precision {p}"
-               .format(N=str(N), p=str(prec)))
+    if len(precomputed) <= terms or any(precomputed[k] is None
+                                        for k in range(1, terms + 1)):
+        raise KeyError("Some k are missing for dimension {N} and precision {p}"
+                       .format(N=str(N), p=str(prec)))
 
     return precomputed
 
 
-def precomputeFresnelTerms(N, terms=None, prec=None, verbose=False):
+def retrieveDoublePrecomputed(N, terms=None, prec=None):
+    """
+    The terms of retrievePrecomputed rounded to Python complex numbers, as a
+    list whose (k - 1)th entry is the kth term
+    """
+    if terms is None:
+        terms = default_terms(N)
+    if prec is None:
+        prec = default_prec
+    return _retrieveDoublePrecomputed(N, terms, prec)
+
+
+@functools.lru_cache(maxsize=2)
+def _retrieveDoublePrecomputed(N, terms, prec):
+    precomputed = _retrievePrecomputed(N, terms, prec)
+    return [complex(precomputed[k]) for k in range(1, terms + 1)]
+
+
+def _fresnelTerms(N, ks, prec):
+    """
+    Computes (C(x) - i S(x) / (x))**N for x = sqrt(2 * pi * k / N) and each k
+    in ks, see precomputeFresnelTerms
+
+    :param N:       we work in RR^N
+    :param ks:      an iterable of the k to compute terms for
+    :param prec:    the amount of precision with which to compute with
+
+    :returns:       a list of pairs (k, term)
+
+    ..note::        if python-flint is available Arb computes the terms
+    """
+    mp.prec = prec
+
+    if flint is not None:
+        return _fresnelTermsArb(N, ks, prec)
+
+    mpN = mp.mpf(N)
+
+    # invariants of the loop below, x = fresnelBase * sqrt(k) and
+    # x^2 = fresnelSquareBase * k
+    fresnelSquareBase = mp.mpf('2') * mp.pi / mpN
+    fresnelBase = mp.sqrt(fresnelSquareBase)
+    fresnelCorrection = mp.sqrt(mp.mpf('2') / mp.pi)
+    fresnelScale = mp.sqrt(mp.pi / mp.mpf('2'))
+
+    computed = []
+
+    for k in ks:
+        mpk = mp.mpf(k)
+
+        fresnelSquare = fresnelSquareBase * mpk
+        # beyond this the Taylor series carries too many extra bits to beat
+        # mpmath's asymptotic expansions
+        if fresnelSquare <= prec / 10:
+            fresnelCos, fresnelSin = _fresnelPair(fresnelSquare, prec)
+            fresnelEstimate = mp.mpc(fresnelCos, -fresnelSin)
+        else:
+            fresnelInput = fresnelBase * mp.sqrt(mpk)
+            fresnelcPre = mp.fresnelc(fresnelCorrection * fresnelInput)
+            fresnelsPre = mp.fresnels(fresnelCorrection * fresnelInput) * mp.j
+            fresnelPreEstimate = fresnelScale * (fresnelcPre - fresnelsPre)
+            fresnelEstimate = fresnelPreEstimate / fresnelInput
+        fresnelFinal = _mpcPowInt(fresnelEstimate, int(N))
+
+        computed.append((k, fresnelFinal))
+
+    return computed
+
+
+def _fresnelPair(x2, prec):
+    """
+    Computes C(x) / x and S(x) / x together, from the single Taylor series
+        (C(x) - i S(x)) / x = 1F1(1/2; 3/2; -i x^2)
+                            = sum_n (-i x^2)^n / (n! (2n + 1))
+    whose even and odd terms give C and S respectively
+
+    :param x2:      x^2
+    :param prec:    the amount of precision with which to compute with
+
+    :returns:       a pair (C(x) / x, S(x) / x)
+
+    ..note::        the terms grow to about exp(x^2) before decaying, so that
+                    many extra bits are carried in the fixed point sums
+    """
+    # log2(e) < 1.45
+    wp = prec + 20 + int(x2 * 1.45)
+    fixedSquare = int(mp.ldexp(x2, wp))
+
+    # term is x^(2n) / n! in fixed point, and (-i)^n has period four so each
+    # pass of the loop takes four terms
+    term = 1 << wp
+    fixedCos = 0
+    fixedSin = 0
+    n = 0
+    while term:
+        fixedCos += term // (2 * n + 1)
+        term = ((term * fixedSquare) >> wp) // (n + 1)
+        fixedSin += term // (2 * n + 3)
+        term = ((term * fixedSquare) >> wp) // (n + 2)
+        fixedCos -= term // (2 * n + 5)
+        term = ((term * fixedSquare) >> wp) // (n + 3)
+        fixedSin -= term // (2 * n + 7)
+        term = ((term * fixedSquare) >> wp) // (n + 4)
+        n += 4
+
+    return mp.ldexp(fixedCos, -wp), mp.ldexp(fixedSin, -wp)
+
+
+def _mpcPowInt(z, n):
+    """
+    Computes z**n for an mp.mpc z and a positive int n by repeated squaring,
+    mpmath's own integer power goes through exp(n log z) once n times the
+    precision is large, which is every N of interest here
+
+    ..note::        the relative error can double with each squaring, so
+                    log2(n) guard bits are carried
+    """
+    with mp.workprec(mp.prec + n.bit_length() + 10):
+        result = mp.mpc(1)
+        base = +z
+        while n:
+            if n & 1:
+                result *= base
+            n >>= 1
+            if n:
+                base *= base
+    return +result
+
+
+def _fresnelTermsArb(N, ks, prec):
+    """
+    As _fresnelTerms, but using the Fresnel integrals of Arb via python-flint
+
+    ..note::        with y = sqrt(2 / pi) * x = 2 * sqrt(k / N) the term is
+                    (fresnel_c(y) - i fresnel_s(y)) / y in the ``normalised``
+                    Fresnel integrals, see precomputeFresnelTerms
+    """
+    previousPrec = flint.ctx.prec
+    # guard bits for the error the balls accumulate over the power
+    flint.ctx.prec = prec + 32
+    try:
+        computed = []
+        for k in ks:
+            fresnelInput = 2 * flint.arb(flint.fmpq(k, N)).sqrt()
+            fresnelEstimate = flint.acb(fresnelInput.fresnel_c(),
+                                        -fresnelInput.fresnel_s())
+            fresnelEstimate /= fresnelInput
+            fresnelFinal = fresnelEstimate ** int(N)
+            computed.append((k, mp.mpc(_arbToMpf(fresnelFinal.real),
+                                       _arbToMpf(fresnelFinal.imag))))
+    finally:
+        flint.ctx.prec = previousPrec
+
+    return computed
+
+
+def _arbToMpf(x):
+    """
+    The midpoint of the arb x as an mpf, rounded to the current precision
+    """
+    man, exp = x.mid().man_exp()
+    return mp.mpf((int(man), int(exp)))
+
+
+def precomputeFresnelTerms(N, terms=None, prec=None, verbose=False,
+                           workers=None):
     """
     Precomputes (per k in (2.6) of https://arxiv.org/abs/1804.07861) the term
         - (1 / k) * (C(x) - i S(x) / (x))**N
@@ -130,6 +505,8 @@ def precomputeFresnelTerms(N, terms=None, prec=None, verbose=False):
                         if ``None`` use default_terms(N)
     :param prec:    the amount of precision with which to compute with, see
                         mpmath documentation
+    :param workers: the number of processes to compute missing terms with,
+                        if ``None`` use os.cpu_count()
 
     ..note::        this is assuming the fixed version of the arXiv paper is
                     uploaded
@@ -142,7 +519,14 @@ def precomputeFresnelTerms(N, terms=None, prec=None, verbose=False):
                     If we want C(x) and S(x) then:
                         - C(x) = sqrt(pi / 2) * mp.fresnelc(sqrt(2 / pi) * x)
                         - S(x) = sqrt(pi / 2) * mp.fresnels(sqrt(2 / pi) * x)
-                    hence the fiddling that goes on below
+                    hence the fiddling that goes on in _fresnelTerms
+
+    ..note::        each k is independent, so missing terms are computed in
+                    chunks across a pool of processes. Under the spawn and
+                    forkserver start methods the workers import this module
+                    by name, which fails if it was attach()ed into __main__
+                    (as in Sage), so then, and if the pool breaks, the terms
+                    are computed in this process instead
     """
     if terms is None:
         terms = default_terms(N)
@@ -150,6 +534,8 @@ def precomputeFresnelTerms(N, terms=None, prec=None, verbose=False):
         mp.prec = default_prec
     else:
         mp.prec = prec
+    if workers is None:
+        workers = os.cpu_count() or 1
 
     if not os.path.exists("precomps/"):
         os.mkdir("precomps/")
@@ -157,37 +543,49 @@ def precomputeFresnelTerms(N, terms=None, prec=None, verbose=False):
     filename = "precomps/" + "dim{N}-prec{p}".format(N=str(N), p=str(mp.prec))
 
     try:
-        with open(filename, 'rb') as fh:
-            precomputed = pickle.load(fh)
+        precomputed = _loadPrecomputed(filename)
     except FileNotFoundError:
         if verbose:
             print("Creating:", filename)
-        precomputed = {}
+        precomputed = [None]
+
+    if len(precomputed) <= terms:
+        precomputed.extend([None] * (terms + 1 - len(precomputed)))
 
     # test whether all necessary terms already precomputed
-    if all(x in precomputed.keys() for x in range(1, terms+1)):
+    missing = [k for k in range(1, terms + 1) if precomputed[k] is None]
+    if not missing:
         return
 
-    mpN = mp.mpf(N)
+    chunks = [missing[i:i + chunksize]
+              for i in range(0, len(missing), chunksize)]
 
-    for k in range(1, terms + 1):
-        if k in precomputed.keys():
-            continue
+    startMethod = (multiprocessing.get_start_method(allow_none=True)
+                   or multiprocessing.get_all_start_methods()[0])
+    if _fresnelTerms.__module__ == '__main__' and startMethod != 'fork':
+        workers = 1
 
-        mpk = mp.mpf(str(int(k)))
+    if workers > 1 and len(chunks) > 1:
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                for computed in executor.map(_fresnelTerms, repeat(N), chunks,
+                                             repeat(mp.prec)):
+                    for k, term in computed:
+                        precomputed[k] = term
+        except BrokenProcessPool:
+            if verbose:
+                print("Process pool failed, computing terms in process")
 
-        fresnelInput = mp.sqrt(mp.mpf('2') * mp.pi * mpk / mpN)
-        fresnelCorrection = mp.sqrt(mp.mpf('2') / mp.pi)
-        fresnelcPre = mp.fresnelc(fresnelCorrection * fresnelInput)
-        fresnelsPre = mp.fresnels(fresnelCorrection * fresnelInput) * mp.j
-        fresnelPreEstimate = mp.sqrt(mp.pi / mp.mpf('2')) * (fresnelcPre - fresnelsPre)  # noqa
-        fresnelEstimate = fresnelPreEstimate / fresnelInput
-        fresnelFinal = mp.power(fresnelEstimate, mpN)
+    missing = [k for k in missing if precomputed[k] is None]
+    for i in range(0, len(missing), chunksize):
+        for k, term in _fresnelTerms(N, missing[i:i + chunksize], mp.prec):
+            precomputed[k] = term
 
-        precomputed[k] = fresnelFinal
+    _savePrecomputed(filename, precomputed)
 
-    with open(filename, 'wb') as fh:
-        pickle.dump(precomputed, fh, protocol=pickle.HIGHEST_PROTOCOL)
+    # any cached retrievals of the old file are now stale
+    _retrievePrecomputed.cache_clear()
+    _retrieveDoublePrecomputed.cache_clear()
 
 
 def asymptoticEstimate(N, s):
@@ -209,3 +607,27 @@ def asymptoticEstimate(N, s):
     mpy = (mp.mpf(1) - Exp) / Var
     prob = (mp.mpf(1) + mp.erf(mpy / mp.sqrt(mp.mpf(2)))) / mp.mpf(2)
     return logBox + mp.log(prob)
+
+
+def asymptoticEstimateDouble(N, s):
+    """
+    As asymptoticEstimate, but computed in Python floats, which is ample for
+    a sanity reference and far cheaper than mpmath at default_prec
+
+    :returns:       a float
+
+    ..note:: method only works for us when s > N/3
+    """
+    assert s > N/3
+    N = float(N)
+    s = float(s)
+    # first term of (3)
+    logBox = N * math.log(2 / math.sqrt(s))
+    # appealing to Thm 3 itself
+    Exp = N / (3 * s)
+    Var = 4 * N / (45 * s ** 2)
+    # solve for y
+    y = (1 - Exp) / Var
+    # s > N/3 makes y positive, so prob >= 1/2 and nothing underflows
+    prob = (1 + math.erf(y / math.sqrt(2))) / 2
+    return logBox + math.log(prob)